@@ -0,0 +1,16 @@
+"""
+Fixtures shared across test modules.
+
+"""
+import pytest
+
+from urbansim_templates import modelmanager
+
+
+@pytest.fixture(scope='module')
+def mm_init():
+    """
+    Initialize ModelManager once per module.
+    
+    """
+    modelmanager.initialize()
@@ -8,13 +8,23 @@ from urbansim_templates.models import BinaryLogitStep
 from urbansim_templates.utils import validate_template
 
 
-@pytest.fixture
-def orca_session():
-    d1 = {'a': np.random.random(100),
-          'b': np.random.randint(2, size=100)}
+@pytest.fixture(scope='module')
+def obs():
+    """
+    Generate the observations once per module.
+    
+    """
+    rng = np.random.default_rng(0)
+    
+    d1 = {'a': rng.random(100),
+          'b': rng.integers(2, size=100)}
 
-    obs = pd.DataFrame(d1)
-    orca.add_table('obs', obs)
+    return pd.DataFrame(d1)
+
+
+@pytest.fixture
+def orca_session(obs):
+    orca.add_table('obs', obs.copy())
 
 
 def test_template_validity():
@@ -25,13 +35,11 @@ def test_template_validity():
     assert validate_template(BinaryLogitStep)
 
 
-def test_binary_logit(orca_session):
+def test_binary_logit(orca_session, mm_init):
     """
     For now this just tests that the code runs.
     
     """
-    modelmanager.initialize()
-
     m = BinaryLogitStep()
     m.tables = 'obs'
     m.model_expression = 'b ~ a'
@@ -40,8 +48,47 @@ def test_binary_logit(orca_session):
     
     m.name = 'binary-test'
     modelmanager.register(m)
+    modelmanager.remove_step('binary-test')
+
+
+def test_property_persistence(orca_session, mm_init):
+    """
+    Test persistence of properties across registration, saving, and reloading.
     
+    """
+    m = BinaryLogitStep()
+    m.tables = 'obs'
+    m.model_expression = 'b ~ a'
+    m.fit()
+    
+    m.name = 'binary-test'
+    m.tags = ['one', 'two']
+    
+    d1 = m.to_dict()
+    modelmanager.register(m)
     modelmanager.initialize()
-    m = modelmanager.get_step('binary-test')
+    d2 = modelmanager.get_step(m.name).to_dict()
+    
+    assert d1 == d2
+    modelmanager.remove_step(m.name)
+
+
+def test_simulation_missing_outcomes(orca_session):
+    """
+    Simulation should cover observations whose outcome is missing, since only the 
+    right-hand side of the model expression is needed for prediction.
+    
+    """
+    m = BinaryLogitStep()
+    m.tables = 'obs'
+    m.model_expression = 'b ~ a'
+    m.fit()
+    
+    obs = orca.get_table('obs').to_frame()
+    obs['b'] = obs.b.astype(float)
+    obs.loc[:9, 'b'] = np.nan
+    orca.add_table('obs', obs)
     
-    modelmanager.remove_step('binary-test')
\ No newline at end of file
+    m.run()
+    assert len(m.probabilities) == len(obs)
+    assert orca.get_table('obs').to_frame().b.notnull().all()
@@ -21,6 +21,17 @@ def test_expression_settings_persistence():
     assert(d == obj.to_dict() == ExpressionSettings.from_dict(d).to_dict())
 
 
+def test_shared_settings_slots():
+    """
+    Confirm the shared settings objects held by the template don't carry an instance 
+    __dict__.
+    
+    """
+    c = ColumnFromExpression()
+    assert(not hasattr(c.meta, '__dict__'))
+    assert(not hasattr(c.output, '__dict__'))
+
+
 def test_legacy_data_loader(orca_session):
     """
     Check that loading a saved dict with the legacy format works.
@@ -60,9 +71,10 @@ def orca_session():
     orca.clear_all()
     modelmanager.initialize()
 
+    rng = np.random.default_rng(0)
     d1 = {'id': np.arange(5), 
-          'a': np.random.random(5),
-          'b': np.random.choice(np.arange(20), size=5)}
+          'a': rng.random(5),
+          'b': rng.choice(np.arange(20), size=5)}
 
     df = pd.DataFrame(d1).set_index('id')
     orca.add_table('obs', df)
@@ -27,8 +27,10 @@ def data(request):
     Create some data files on disk.
     
     """
+    rng = np.random.default_rng(0)
+    
     d1 = {'building_id': np.arange(10),
-          'price': 1e6*np.random.random(10)}
+          'price': 1e6*rng.random(10)}
     
     bldg = pd.DataFrame(d1).set_index('building_id')
     bldg.to_csv('data/buildings.csv')
@@ -27,8 +27,10 @@ def data():
     Create a data table.
     
     """
+    rng = np.random.default_rng(0)
+    
     d1 = {'building_id': np.arange(10),
-          'price': (1e6*np.random.random(10)).astype(int)}
+          'price': (1e6*rng.random(10)).astype(int)}
     
     df = pd.DataFrame(d1).set_index('building_id')
     
@@ -108,9 +110,11 @@ def test_columns(orca_session, data):
     Test requesting specific columns.
     
     """
+    rng = np.random.default_rng(1)  # differs from the seed in data()
+    
     update_column(table = 'buildings', 
                   column = 'price2', 
-                  data = (1e6*np.random.random(10)).astype(int))
+                  data = (1e6*rng.random(10)).astype(int))
     
     t = SaveTable()
     t.table = 'buildings'
@@ -122,6 +126,63 @@ def test_columns(orca_session, data):
     
     df = pd.read_csv(t.path).set_index('building_id')
     assert(list(df.columns) == ['price2'])
+    assert(df.price2.equals(orca.get_table('buildings').to_frame()['price2']))
+    assert(not df.price2.equals(orca.get_table('buildings').to_frame()['price']))
+
+
+def test_registered_columns(orca_session, data):
+    """
+    Test that computed columns are included when saving a whole table.
+    
+    """
+    @orca.column('buildings')
+    def price_k(buildings):
+        return buildings.price / 1000
+    
+    t = SaveTable()
+    t.table = 'buildings'
+    t.output_type = 'csv'
+    t.path = 'data/buildings.csv'
+    
+    t.run()
+    
+    df = pd.read_csv(t.path).set_index('building_id')
+    assert('price_k' in df.columns)
+    
+    os.remove(t.path)
+
+
+def test_table_function(orca_session):
+    """
+    Test that saving a table function with a computed column doesn't evaluate the 
+    function more often than loading the table does.
+    
+    """
+    calls = []
+    
+    @orca.table('buildings')
+    def buildings():
+        calls.append('buildings')
+        d = {'building_id': np.arange(10), 'price': np.arange(10)}
+        return pd.DataFrame(d).set_index('building_id')
+    
+    @orca.column('buildings')
+    def price_k(buildings):
+        return buildings.price / 1000
+    
+    orca.get_table('buildings').to_frame()
+    num_calls = len(calls)
+    del calls[:]
+    
+    t = SaveTable()
+    t.table = 'buildings'
+    t.output_type = 'csv'
+    t.path = 'data/buildings.csv'
+    
+    t.run()
+    assert(len(calls) == num_calls)
+    
+    os.remove(t.path)
 
 
 def test_filters(orca_session, data):
@@ -12,12 +12,14 @@ from urbansim_templates.utils import validate_template
 
 @pytest.fixture
 def orca_session():
+    rng = np.random.default_rng(0)
+
     d1 = {'oid': np.arange(10), 
-          'obsval': np.random.random(10),
-          'choice': np.random.choice(np.arange(20), size=10)}
+          'obsval': rng.random(10),
+          'choice': rng.choice(np.arange(20), size=10)}
 
     d2 = {'aid': np.arange(20), 
-          'altval': np.random.random(20)}
+          'altval': rng.random(20)}
 
     obs = pd.DataFrame(d1).set_index('oid')
     orca.add_table('obs', obs)
@@ -34,9 +36,7 @@ def test_template_validity():
     assert validate_template(LargeMultinomialLogitStep)
 
 
-def test_observation_sampling(orca_session):
-    modelmanager.initialize()
-
+def test_observation_sampling(orca_session, mm_init):
     m = LargeMultinomialLogitStep()
     m.choosers = 'obs'
     m.alternatives = 'alts'
@@ -60,23 +60,34 @@ def test_observation_sampling(orca_session):
     modelmanager.remove_step('mnl-test')
 
 
-@pytest.fixture
-def data():
+@pytest.fixture(scope='module')
+def tables():
+    """
+    Generate the observations and alternatives once per module.
+    
+    """
+    rng = np.random.default_rng(0)
+    
     num_obs = 100
     num_alts = 120
     
     d1 = {'oid': np.arange(num_obs), 
-          'obsval': np.random.random(num_obs),
-          'choice': np.random.choice(np.arange(num_alts), size=num_obs)}
+          'obsval': rng.random(num_obs),
+          'choice': rng.choice(np.arange(num_alts), size=num_obs)}
 
     d2 = {'aid': np.arange(num_alts), 
-          'altval': np.random.random(num_alts)}
+          'altval': rng.random(num_alts)}
 
     obs = pd.DataFrame(d1).set_index('oid')
-    orca.add_table('obs', obs)
-
     alts = pd.DataFrame(d2).set_index('aid')
-    orca.add_table('alts', alts)
+    return obs, alts
+
+
+@pytest.fixture
+def data(tables):
+    obs, alts = tables
+    orca.add_table('obs', obs.copy())
+    orca.add_table('alts', alts.copy())
 
 
 @pytest.fixture
@@ -96,7 +107,7 @@ def m(data):
     return m
 
 
-def test_property_persistence(m):
+def test_property_persistence(m, mm_init):
     """
     Test persistence of properties across registration, saving, and reloading.
     
@@ -118,7 +129,6 @@ def test_property_persistence(m):
     m.max_iter = 17
     
     d1 = m.to_dict()
-    modelmanager.initialize()
     modelmanager.register(m)
     modelmanager.initialize()
     d2 = modelmanager.get_step('my-model').to_dict()
@@ -163,13 +173,15 @@ def test_simulation_constrained(m):
     Test simulation of choices with explicit capacities and sizes.
     
     """
+    rng = np.random.default_rng(1)  # differs from the seed in tables()
+    
     obs = orca.get_table('obs').to_frame()
     obs.loc[:,'choice'] = -1
-    obs['size'] = np.random.choice([1,2], size=len(obs))
+    obs['size'] = rng.choice([1,2], size=len(obs))
     orca.add_table('obs', obs)
     
     alts = orca.get_table('alts').to_frame()
-    alts['cap'] = np.random.choice([1,2,3], size=len(alts))
+    alts['cap'] = rng.choice([1,2,3], size=len(alts))
     orca.add_table('alts', alts)
     
     m.constrained_choices = True
@@ -211,7 +223,7 @@ def test_output_column_autocreation(m):
     assert(m.choices.equals(orca.get_table('obs').to_frame()['potato_chips']))
     
 
-def test_diagnostic_attributes(data):
+def test_diagnostic_attributes(data, mm_init):
     """
     Test that diagnostic attributes are available when expected.
     
@@ -8,13 +8,23 @@ from urbansim_templates.models import OLSRegressionStep
 from urbansim_templates.utils import validate_template
 
 
-@pytest.fixture
-def orca_session():
-    d1 = {'a': np.random.random(100),
-          'b': np.random.random(100)}
+@pytest.fixture(scope='module')
+def obs():
+    """
+    Generate the observations once per module.
+    
+    """
+    rng = np.random.default_rng(0)
+    
+    d1 = {'a': rng.random(100),
+          'b': rng.random(100)}
+
+    return pd.DataFrame(d1)
+
 
-    obs = pd.DataFrame(d1)
-    orca.add_table('obs', obs)
+@pytest.fixture
+def orca_session(obs):
+    orca.add_table('obs', obs.copy())
 
 
 def test_template_validity():
@@ -25,13 +35,11 @@ def test_template_validity():
     assert validate_template(OLSRegressionStep)
 
 
-def test_ols(orca_session):
+def test_ols(orca_session, mm_init):
     """
     For now this just tests that the code runs.
     
     """
-    modelmanager.initialize()
-
     m = OLSRegressionStep()
     m.tables = 'obs'
     m.model_expression = 'a ~ b'
@@ -40,20 +48,36 @@ def test_ols(orca_session):
     
     m.name = 'ols-test'
     modelmanager.register(m)
+    modelmanager.remove_step('ols-test')
+
+
+def test_property_persistence(orca_session, mm_init):
+    """
+    Test persistence of properties across registration, saving, and reloading.
     
+    """
+    m = OLSRegressionStep()
+    m.tables = 'obs'
+    m.model_expression = 'a ~ b'
+    m.fit()
+    
+    m.name = 'ols-test'
+    m.tags = ['one', 'two']
+    
+    d1 = m.to_dict()
+    modelmanager.register(m)
     modelmanager.initialize()
-    m = modelmanager.get_step('ols-test')
+    d2 = modelmanager.get_step(m.name).to_dict()
     
-    modelmanager.remove_step('ols-test')
+    assert d1 == d2
+    modelmanager.remove_step(m.name)
 
 
-def test_simulation(orca_session):
+def test_simulation(orca_session, mm_init):
     """
     Test that predicted values are correctly written to Orca.
     
     """
-    modelmanager.initialize()
-    
     m = OLSRegressionStep()
     m.tables = 'obs'
     m.model_expression = 'a ~ b'
@@ -65,13 +89,11 @@ def test_simulation(orca_session):
     assert orca.get_table('obs').to_frame()['a_predicted'].equals(m.predicted_values)
 
 
-def test_out_transform(orca_session):
+def test_out_transform(orca_session, mm_init):
     """
     Test transformation of the predicted values.
     
     """
-    modelmanager.initialize()
-    
     m = OLSRegressionStep()
     m.tables = 'obs'
     m.model_expression = 'a ~ b'
@@ -10,48 +10,47 @@ from urbansim_templates.models import SegmentedLargeMultinomialLogitStep
 from urbansim_templates.utils import get_data, validate_template
 
 
-@pytest.fixture
+@pytest.fixture(scope='module')
 def orca_session():
     """
-    Set up a clean Orca session with a couple of data tables.
+    Set up an Orca session with a couple of data tables, shared by the tests in this 
+    module. Tests should not modify the tables.
     
     """
+    rng = np.random.default_rng(0)
+    
     d1 = {'oid': np.arange(100), 
-          'group': np.random.choice(['A','B','C'], size=100),
-          'int_group': np.random.choice([3,4], size=100),
-          'obsval': np.random.random(100),
-          'choice': np.random.choice(np.arange(20), size=100)}
+          'group': rng.choice(['A','B','C'], size=100),
+          'int_group': rng.choice([3,4], size=100),
+          'obsval': rng.random(100),
+          'choice': rng.choice(np.arange(20), size=100)}
 
     d2 = {'aid': np.arange(20), 
-          'altval': np.random.random(20)}
+          'altval': rng.random(20)}
 
     obs = pd.DataFrame(d1).set_index('oid')
     orca.add_table('obs', obs)
 
     alts = pd.DataFrame(d2).set_index('aid')
     orca.add_table('alts', alts)
+    
+    yield
+    orca.clear_all()
 
 
-@pytest.fixture
-def orca_session_alts_as_list():
+@pytest.fixture(scope='module')
+def orca_session_alts_as_list(orca_session):
     """
-    Set up a clean Orca session with a couple of data tables.
+    Add a second set of alternatives, split across two tables.
     
     """
-    d1 = {'oid': np.arange(100),
-          'group': np.random.choice(['A', 'B', 'C'], size=100),
-          'int_group': np.random.choice([3, 4], size=100),
-          'obsval': np.random.random(100),
-          'choice': np.random.choice(np.arange(20), size=100)}
-
+    rng = np.random.default_rng(0)
+    
     d2 = {'aid': np.arange(20),
-          'altval': np.random.random(20)}
+          'altval': rng.random(20)}
 
     d3 = {'aid': np.arange(20),
-          'altval_2': np.random.random(20)}
-
-    obs = pd.DataFrame(d1).set_index('oid')
-    orca.add_table('obs', obs)
+          'altval_2': rng.random(20)}
 
     d2_df = pd.DataFrame(d2).set_index('aid')
     orca.add_table('d2', d2_df)
@@ -109,6 +108,7 @@ def test_basic_operation(m):
     m.to_dict()
     assert len(m.submodels) == 3
 
+
 def test_basic_operation_alts_as_list(m_alts_as_list):
     """
     Test basic operation of the template.
@@ -119,16 +119,7 @@ def test_basic_operation_alts_as_list(m_alts_as_list):
     m.to_dict()
     assert len(m.submodels) == 3
 
-def test_basic_operation(m):
-    """
-    Test basic operation of the template.
-    
-    """
-    m.fit_all()
-    m.to_dict()
-    assert len(m.submodels) == 3
-    
-    
+
 def test_numeric_segments(m):
     """
     Test support for using ints as categorical variables.
@@ -139,18 +130,32 @@ def test_numeric_segments(m):
     assert len(m.submodels) == 2
     
 
-def test_chooser_filters(m):
+@pytest.mark.parametrize('filters, num_submodels', [
+        ("group != 'A'", 2),
+        (["group != 'A'", "group != 'B'"], 1)])
+def test_chooser_filters(m, filters, num_submodels):
     """
     Test that the default chooser filters generate the correct data subset.
     
     """
-    m.defaults.chooser_filters = "group != 'A'"
+    m.defaults.chooser_filters = filters
     m.build_submodels()
-    assert len(m.submodels) == 2 
+    assert len(m.submodels) == num_submodels
 
-    m.defaults.chooser_filters = ["group != 'A'", "group != 'B'"]
+
+def test_categorical_segments(m):
+    """
+    Test that categories removed by the chooser filters don't generate submodels.
+    
+    """
+    obs = orca.get_table('obs').to_frame()
+    obs['group'] = pd.Categorical(obs.group)
+    orca.add_table('obs_categorical', obs)
+    
+    m.defaults.choosers = 'obs_categorical'
+    m.defaults.chooser_filters = "group != 'A'"
     m.build_submodels()
-    assert len(m.submodels) == 1
+    assert sorted(m.submodels.keys()) == ['B', 'C']
 
 
 def test_alternative_filters(m):
@@ -160,8 +165,8 @@ def test_alternative_filters(m):
     """
     m.defaults.alt_filters = 'aid < 5'
     
-    df = orca.get_table(m.defaults.choosers).to_frame()
-    len1 = len(df.loc[df.choice < 5])
+    choice = orca.get_table(m.defaults.choosers).get_column('choice')
+    len1 = np.count_nonzero(choice < 5)
     len2 = len(m.get_segmentation_column())
     
     assert len1 == len2
@@ -188,14 +193,14 @@ def test_submodel_filters(m):
     """
     m.build_submodels()
     
-    df = orca.get_table(m.defaults.choosers).to_frame()
+    df = orca.get_table(m.defaults.choosers).to_frame(columns=['group'])
     len1 = len(apply_filter_query(df.loc[df.group == 'A'], m.defaults.chooser_filters))
     len2 = len(apply_filter_query(df, m.submodels['A'].chooser_filters))
     
     assert len1 == len2
     
 
-def test_property_persistence(m):
+def test_property_persistence(m, mm_init):
     """
     Test persistence of properties across registration, saving, and reloading.
     
@@ -204,7 +209,6 @@ def test_property_persistence(m):
     m.tags = ['one','two']
     m.fit_all()
     d1 = m.to_dict()
-    modelmanager.initialize()
     modelmanager.register(m)
     modelmanager.initialize()
     d2 = modelmanager.get_step('test').to_dict()
@@ -212,19 +216,18 @@ def test_property_persistence(m):
     modelmanager.remove_step('test')
     
 
-def test_filter_generation(m):
+@pytest.mark.parametrize('filters, submodel_filters', [
+        ('obsval > 0.5', ['obsval > 0.5', "group == 'A'"]),
+        (['obsval > 0.5', 'obsval < 0.9'], 
+                ['obsval > 0.5', 'obsval < 0.9', "group == 'A'"])])
+def test_filter_generation(m, filters, submodel_filters):
     """
     Test additional cases of generating submodel filters.
     
     """
-    m.defaults.chooser_filters = 'obsval > 0.5'
-    m.build_submodels()
-    assert m.submodels['A'].chooser_filters == ['obsval > 0.5', "group == 'A'"]
-    
-    m.defaults.chooser_filters = ['obsval > 0.5', 'obsval < 0.9']
+    m.defaults.chooser_filters = filters
     m.build_submodels()
-    assert m.submodels['A'].chooser_filters == \
-                ['obsval > 0.5', 'obsval < 0.9', "group == 'A'"]
+    assert m.submodels['A'].chooser_filters == submodel_filters
     
 
 @pytest.fixture
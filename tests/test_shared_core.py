@@ -1,7 +1,5 @@
 from __future__ import print_function
 
-import pytest
-
 from urbansim_templates.shared import CoreTemplateSettings
 
 
@@ -24,3 +22,14 @@ def test_property_persistence():
     obj2 = CoreTemplateSettings.from_dict(d)
     assert(obj2.to_dict() == d)
 
+
+def test_default_tags_not_shared():
+    """
+    Confirm that instances created without tags don't share a default list.
+    
+    """
+    obj1 = CoreTemplateSettings()
+    obj2 = CoreTemplateSettings()
+    obj1.tags.append('tag1')
+    
+    assert(obj2.tags == [])
@@ -9,15 +9,17 @@ from urbansim_templates.models import SmallMultinomialLogitStep
 from urbansim_templates.utils import validate_template
 
 
-@pytest.fixture
+@pytest.fixture(scope='module')
 def orca_session():
+    rng = np.random.default_rng(0)
+
     d1 = {'id': np.arange(100),
           'building_id': np.arange(100),
-          'a': np.random.random(100),
-          'choice': np.random.randint(3, size=100)}
+          'a': rng.random(100),
+          'choice': rng.integers(3, size=100)}
     
     d2 = {'building_id': np.arange(100),
-          'b': np.random.random(100)}
+          'b': rng.random(100)}
 
     households = pd.DataFrame(d1).set_index('id')
     orca.add_table('households', households)
@@ -27,6 +29,9 @@ def orca_session():
 
     orca.broadcast(cast='buildings', onto='households', 
                    cast_index=True, onto_on='building_id')
+    
+    yield
+    orca.clear_all()
 
 
 def test_template_validity():
@@ -37,13 +42,11 @@ def test_template_validity():
     assert validate_template(SmallMultinomialLogitStep)
 
 
-def test_small_mnl(orca_session):
+def test_small_mnl(orca_session, mm_init):
     """
     Test that the code runs, and that the model_expression is always available.
     
     """
-    modelmanager.initialize()
-
     m = SmallMultinomialLogitStep()
     m.tables = ['households', 'buildings']
     m.choice_column = 'choice'
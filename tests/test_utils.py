@@ -13,6 +13,10 @@ def test_parse_version():
     assert utils.parse_version('3.1.dev7') == (3, 1, 0, 7)
     assert utils.parse_version('5.4') == (5, 4, 0, None)
 
+def test_parse_version_invalid():
+    with pytest.raises(ValueError):
+        utils.parse_version('0.1.potato')
+
 def test_version_greater_or_equal():
     assert utils.version_greater_or_equal('2.0', '0.1.1') == True    
     assert utils.version_greater_or_equal('0.1.1', '2.0') == False    
@@ -25,6 +29,39 @@ def test_version_greater_or_equal():
     assert utils.version_greater_or_equal('1.1.3.dev0', '1.1.3') == False
 
 
+###############################
+## validate_template
+
+def test_validate_template_missing_method():
+    """
+    Confirm that validate_template() rejects a class without a 'run' method.
+    
+    """
+    class Template():
+        def to_dict(self):
+            return {'name': None, 'tags': [], 'template': 'Template', 
+                    'template_version': None}
+        
+        @classmethod
+        def from_dict(cls, d):
+            return cls()
+    
+    assert utils.validate_template(Template) == False
+
+
+def test_validate_template_required_argument():
+    """
+    Confirm that validate_template() rejects a class whose constructor requires 
+    arguments, without trying to instantiate it.
+    
+    """
+    class Template():
+        def __init__(self, name):
+            raise AssertionError("Constructor should not be called")
+    
+    assert utils.validate_template(Template) == False
+
+
 ###############################
 ## get_df
 
@@ -86,6 +123,29 @@ def test_get_df_columns(df):
     pd.testing.assert_frame_equal(df[['val1']], df_out)    
     
 
+def test_get_df_column_order(df):
+    """
+    Confirm that get_df() returns columns in the order they appear in the table.
+    
+    """
+    dfw = orca.DataFrameWrapper('df', df)
+    df_out = utils.get_df(dfw, ['val2', 'val1'])
+    assert list(df_out.columns) == ['val1', 'val2']
+    
+    df_out = utils.get_df(df[['val1', 'val2']], ['val2', 'val3'])
+    assert list(df_out.columns) == ['val2']
+
+
+def test_get_df_all_columns(df):
+    """
+    Confirm that get_df() passes a DataFrame through without copying it when all of its 
+    columns are requested.
+    
+    """
+    df_out = utils.get_df(df, ['id', 'val1', 'val2', 'val3'])
+    assert df_out is df
+    
+
 def test_get_df_unsupported_type(df):
     """
     Confirm that get_df() raises an error for an unsupported type.
@@ -206,6 +266,28 @@ def test_get_data_single_table(orca_session):
     assert(len(df) == 3)
 
 
+def test_get_data_repeated_tables(orca_session):
+    """
+    Repeated table names should be ignored.
+        
+    """
+    df = utils.get_data(tables = ['households', 'buildings', 'households'], 
+                        model_expression = 'tenure ~ pop')
+    
+    assert(set(df.columns) == set(['tenure', 'pop']))
+    assert(len(df) == 3)
+    
+    df = utils.get_data(tables = ['households', 'households'])
+    assert(len(df) == 3)
+    
+    households = orca.get_table('households').to_frame()
+    df = utils.get_data(tables = [households, 'buildings', households], 
+                        model_expression = 'tenure ~ pop')
+    
+    assert(set(df.columns) == set(['tenure', 'pop']))
+    assert(len(df) == 3)
+
+
 def test_get_data_bad_columns(orca_session):
     """
     Bad column name, should be ignored.
@@ -343,3 +343,22 @@ def test_merge_tables_missing_values():
     assert merged.values.dtype == 'float64'
     
 
+def test_merge_tables_source_not_scanned(orca_session):
+    """
+    Confirm that merging doesn't evaluate a table function just to look up the columns 
+    of the source table, which is never a merge target.
+    
+    """
+    calls = []
+    
+    @orca.table('buildings')
+    def buildings():
+        calls.append('buildings')
+        d = {'building_id': [1,2,3,4], 'value': [4,4,4,4]}
+        return pd.DataFrame(d).set_index('building_id')
+    
+    d = {'household_id': [1,2,3], 'building_id': [2,3,4]}
+    households = pd.DataFrame(d).set_index('household_id')
+    
+    merge_tables([households, 'buildings'])
+    assert len(calls) == 1
@@ -1 +1 @@
-version = __version__ = '0.2.dev9'
+version = __version__ = '0.2.dev10'
@@ -191,9 +191,19 @@ class SaveTable():
         if kwargs is None:
             kwargs = dict()
 
-        df = get_data(tables = self.table, 
-                      filters = self.filters, 
-                      extra_columns = self.columns)
+        # Look up the table once: for a table function this evaluates the function
+        dfw = orca.get_table(self.table)
+        
+        if (self.filters is None) and (self.columns is None) and \
+                (len(dfw.columns) == len(dfw.local_columns)):
+            # Saving the whole table only reads it, so skip the copy made by to_frame() 
+            # when there are no registered columns that need to be computed
+            df = dfw.local
+        
+        else:
+            df = get_data(tables = dfw, 
+                          filters = self.filters, 
+                          extra_columns = self.columns)
                 
         if self.output_type == 'csv':
             df.to_csv(self.get_dynamic_filepath(), **kwargs)
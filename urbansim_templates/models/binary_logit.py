@@ -230,8 +230,10 @@ class BinaryLogitStep(TemplateStep):
                       model_expression = self.model_expression,
                       extra_columns = self.out_column)
 
-        dm = patsy.dmatrices(data=df, formula_like=self.model_expression,
-                             return_type='dataframe')[1]  # right-hand-side design matrix
+        # Only the right-hand-side design matrix is needed for prediction
+        rhs = patsy.ModelDesc([], 
+                patsy.ModelDesc.from_formula(self.model_expression).rhs_termlist)
+        dm = patsy.dmatrix(rhs, data=df, return_type='dataframe')
         
         beta_X = np.dot(dm, self.fitted_parameters)
         probs = np.divide(np.exp(beta_X), 1 + np.exp(beta_X))
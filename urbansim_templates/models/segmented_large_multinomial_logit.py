@@ -180,7 +180,9 @@ class SegmentedLargeMultinomialLogitStep(TemplateStep):
                   "alternative filters")
             return
 
-        cats = col.astype('category').cat.categories.values
+        # Categorical columns keep unused categories after filtering, so drop them
+        col = col.astype('category').cat.remove_unused_categories()
+        cats = col.cat.categories.values
 
         print("Building submodels for {} categories: {}".format(len(cats), cats))
 
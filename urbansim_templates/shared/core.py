@@ -1,6 +1,14 @@
+from operator import attrgetter
+
 from urbansim_templates import __version__
 
 
+# Keys of the dictionary representation, in order
+_CORE_KEYS = ('name', 'tags', 'notes', 'autorun', 'template', 'template_version', 
+              'modelmanager_version')
+_CORE_GET = attrgetter(*_CORE_KEYS)
+
+
 class CoreTemplateSettings():
     """
     Stores standard parameters and logic used by all templates. Parameters can be passed 
@@ -29,23 +37,25 @@ class CoreTemplateSettings():
         Version of the template class package.
     
     """
+    __slots__ = ('name', 'tags', 'notes', 'autorun', 'template', 'template_version')
+    
+    # automatic attributes
+    modelmanager_version = __version__
+    
     def __init__(self,
             name = None,
-            tags = [],
+            tags = None,
             notes = None,
             autorun = False,
             template = None,
             template_version = None):
         
         self.name = name
-        self.tags = tags
+        self.tags = [] if tags is None else tags
         self.notes = notes
         self.autorun = autorun
         self.template = template
         self.template_version = template_version
-        
-        # automatic attributes
-        self.modelmanager_version = __version__
     
     
     @classmethod
@@ -82,14 +92,6 @@ class CoreTemplateSettings():
         d : dict
         
         """
-        d = {
-            'name': self.name,
-            'tags': self.tags,
-            'notes': self.notes,
-            'autorun': self.autorun,
-            'template': self.template,
-            'template_version': self.template_version,
-            'modelmanager_version': self.modelmanager_version,
-        }
+        d = dict(zip(_CORE_KEYS, _CORE_GET(self)))
         return d
 
@@ -1,8 +1,16 @@
+from operator import attrgetter
+
 import orca
 
 from urbansim_templates import __version__
 
 
+# Keys of the dictionary representation, in order
+_OUTPUT_KEYS = ('column_name', 'table', 'data_type', 'missing_values', 'cache', 
+                'cache_scope', 'modelmanager_version')
+_OUTPUT_GET = attrgetter(*_OUTPUT_KEYS)
+
+
 class OutputColumnSettings():
     """
     Stores standard parameters used by templates that generate or modify columns. 
@@ -32,6 +40,12 @@ class OutputColumnSettings():
     
     """
     # TO DO: say something about Orca defaults and about core vs. computed columns.
+    
+    __slots__ = ('column_name', 'table', 'data_type', 'missing_values', 'cache', 
+                 'cache_scope')
+    
+    # automatic attributes
+    modelmanager_version = __version__
 
     def __init__(self,
             column_name = None,
@@ -47,9 +61,6 @@ class OutputColumnSettings():
         self.missing_values = missing_values
         self.cache = cache
         self.cache_scope = cache_scope
-        
-        # automatic attributes
-        self.modelmanager_version = __version__
     
     
     @classmethod
@@ -84,14 +95,7 @@ class OutputColumnSettings():
         d : dict
         
         """
-        return {
-            'column_name': self.column_name,
-            'table': self.table,
-            'data_type': self.data_type,
-            'missing_values': self.missing_values,
-            'cache': self.cache,
-            'cache_scope': self.cache_scope,
-            'modelmanager_version': self.modelmanager_version}
+        return dict(zip(_OUTPUT_KEYS, _OUTPUT_GET(self)))
 
 
 ######################################
@@ -1,7 +1,11 @@
 from __future__ import print_function
 
+import inspect
 import re
+import time
 from datetime import datetime as dt
+from functools import lru_cache
+from itertools import chain
 
 import pandas as pd
 
@@ -14,6 +18,9 @@ from urbansim.models.util import (apply_filter_query, columns_in_filters,
 ## SPEC AND FORMAT MANAGEMENT ##
 ################################
 
+_TEMPLATE_METHODS = frozenset(('to_dict', 'from_dict', 'run'))
+_TEMPLATE_KEYS = frozenset(('name', 'tags', 'template', 'template_version'))
+
 def validate_template(cls):
     """
     Checks whether a template class meets the basic expectations for working with 
@@ -39,17 +46,26 @@ def validate_template(cls):
     bool
     
     """
+    params = inspect.signature(cls).parameters.values()
+    required = [p.name for p in params if p.default is p.empty and 
+                p.kind not in (p.VAR_POSITIONAL, p.VAR_KEYWORD)]
+    if required:
+        print("Expecting a constructor without required arguments, found '{}'"
+              .format("', '".join(required)))
+        return False
+    
     try:
         m = cls()
     except:
         print("Error instantiating object without arguments")
         raise
     
-    methods = ['to_dict', 'from_dict', 'run']
-    for item in methods:
-        if item not in dir(cls):
+    missing = {item for item in _TEMPLATE_METHODS 
+               if not callable(getattr(cls, item, None))}
+    if missing:
+        for item in sorted(missing):
             print("Expecting a '{}' method".format(item))
-            return False
+        return False
 
     try:
         d = m.to_dict()
@@ -57,18 +73,18 @@ def validate_template(cls):
         print("Error running 'to_dict()'")
         raise
     
-    params = ['name', 'tags', 'template', 'template_version']
-    for item in params:
-        if item not in d:
+    missing = _TEMPLATE_KEYS.difference(d)
+    if missing:
+        for item in sorted(missing):
             print("Expecting a '{}' key in dict representation".format(item))
-            return False
+        return False
     
     if (d['template'] != m.__class__.__name__):
         print("Expecting 'template' value in dict to match the class name")
         return False
 
     try:
-        cls.from_dict(m.to_dict())
+        cls.from_dict(d)
     except:
         print("Error instantiating object with 'from_dict()' method")
         raise
@@ -135,38 +151,55 @@ def validate_table(table, reciprocal=True):
     if not orca.is_table(table):
         raise ValueError("Table not registered with Orca: '{}'".format(table))
     
-    idx = orca.get_table(table).index
+    # Table functions are evaluated to provide an index or columns, so look these up 
+    # once and reuse them below
+    dfw = orca.get_table(table)
+    table_idx = dfw.index
+    table_cols = set(dfw.columns)
+    
+    idx_names = list(table_idx.names)
     
     # Check index has a name
-    if list(idx.names) == [None]:
+    if idx_names == [None]:
         raise ValueError("Index column has no name")
     
     # Check for unique column names
-    for name in list(idx.names):
-        if name in list(orca.get_table(table).columns):
+    for name in idx_names:
+        if name in table_cols:
             raise ValueError("Index names and column names overlap: '{}'".format(name))
     
     # Check for unique index values
-    if len(idx.unique()) < len(idx):    
+    if not table_idx.is_unique:
         raise ValueError("Index not unique")
     
     # Compare columns to indexes of other tables, and vice versa
-    combinations = [(table, t) for t in orca.list_tables() if table != t]
+    others = [t for t in orca.list_tables() if table != t]
+    combinations = [(table, t) for t in others]
     
     if reciprocal:
-        combinations += [(t, table) for t in orca.list_tables() if table != t]
+        combinations += [(t, table) for t in others]
+    
+    wrappers = {t: orca.get_table(t) for t in others}
+    wrappers[table] = dfw
+    
+    # Unique key values, by (table, key names) -- several tables can share an index
+    key_values = {}
     
     for t1, t2 in combinations:
-        col_names = orca.get_table(t1).columns
-        idx = orca.get_table(t2).index
+        col_names = table_cols if t1 == table else wrappers[t1].columns
+        idx = table_idx if t2 == table else wrappers[t2].index
         
         if set(idx.names).issubset(col_names):
-            vals = orca.get_table(t1).to_frame(idx.names).drop_duplicates()
+            cache_key = (t1, tuple(idx.names))
+            if cache_key not in key_values:
+                vals = wrappers[t1].to_frame(idx.names).drop_duplicates()
+                
+                # Easier to compare multi-column values to multi-column index if we 
+                # turn the values into an index as well
+                key_values[cache_key] = vals.set_index(idx.names).index
             
-            # Easier to compare multi-column values to multi-column index if we 
-            # turn the values into an index as well
-            vals = vals.reset_index().set_index(idx.names).index
-            vals_in_idx = sum(vals.isin(idx))
+            vals = key_values[cache_key]
+            vals_in_idx = int(vals.isin(idx).sum())
             
             if len(idx.names) == 1:
                 idx_str = idx.names[0]
@@ -247,15 +280,23 @@ def merge_tables(tables, columns=None):
     pd.DataFrame
     
     """
+    # column names (including indexes) of candidate targets, by position in the list; 
+    # filled in as needed because looking up an Orca table may evaluate a table function
+    col_sets = {}
+    
     while len(tables) > 1:
         # last table becomes the source
         source = get_df(tables[-1], columns)
         keys = list(source.index.names)
+        key_set = set(keys)
         
         # search for target table
         target_position = None
         for i in range(len(tables)-2, -1, -1):
-            if set(keys).issubset(set(all_cols(tables[i]))):
+            if i not in col_sets:
+                col_sets[i] = set(all_cols(tables[i]))
+            
+            if key_set.issubset(col_sets[i]):
                 target_position = i
                 target_columns = columns + keys if columns is not None else None
                 target = get_df(tables[i], target_columns)
@@ -270,6 +311,8 @@ def merge_tables(tables, columns=None):
         
         tables = tables[:-1]
         tables[target_position] = merged
+        
+        col_sets[target_position] = set(all_cols(merged))
 
     # drop final merge keys if not needed
     merged = trim_cols(merged, columns)
@@ -282,6 +325,8 @@ def merge_tables(tables, columns=None):
 ## TEMPLATE HELPER FUNCTIONS ##
 ###############################
 
+_TABLE_TYPES = (str, orca.DataFrameWrapper, orca.TableFuncWrapper, pd.DataFrame)
+
 def get_df(table, columns=None):
     """
     Returns a table as a ``pd.DataFrame``. Input can be an Orca table name, 
@@ -301,21 +346,18 @@ def get_df(table, columns=None):
     pd.DataFrame
     
     """
-    if type(table) not in [str, 
-                           orca.DataFrameWrapper, 
-                           orca.TableFuncWrapper, 
-                           pd.DataFrame]:
+    if not isinstance(table, _TABLE_TYPES):
         raise ValueError("Table has unsupported type: {}".format(type(table)))
     
-    if type(table) == pd.DataFrame:
+    if isinstance(table, pd.DataFrame):
         return trim_cols(table, columns)
     
-    elif type(table) == str:
+    elif isinstance(table, str):
         table = orca.get_table(table)
     
     if columns is not None:
         # Orca requires column list to be unique and existing, or None
-        columns = list(set(columns) & set(table.columns))
+        columns = pd.Index(table.columns).intersection(columns).tolist()
     
     return table.to_frame(columns=columns)
     
@@ -335,18 +377,17 @@ def all_cols(table):
     list of str
     
     """
-    if type(table) not in [str, 
-                           orca.DataFrameWrapper, 
-                           orca.TableFuncWrapper, 
-                           pd.DataFrame]:
+    if not isinstance(table, _TABLE_TYPES):
         raise ValueError("Table has unsupported type: {}".format(type(table)))
 
-    if type(table) == str:
+    if isinstance(table, str):
         table = orca.get_table(table)
     
     return list(table.index.names) + list(table.columns)
     
 
+_EXPRESSION_TOKEN = re.compile(r'[a-zA-Z_][a-zA-Z0-9_]*(?!\()')
+
 def cols_in_expression(expression):
     """
     Extract all possible column names from a ``df.eval()``-style expression. 
@@ -365,7 +406,7 @@ def cols_in_expression(expression):
     cols : list of str
     
     """
-    return re.findall('[a-zA-Z_][a-zA-Z0-9_]*(?!\()', expression)
+    return _EXPRESSION_TOKEN.findall(expression)
 
 
 def trim_cols(df, columns=None):
@@ -388,8 +429,11 @@ def trim_cols(df, columns=None):
     if columns is None:
         return df
     
-    cols = set(columns) & set(df.columns)  # unique, existing columns
-    return df[list(cols)]
+    cols = df.columns.intersection(columns)  # unique, existing columns
+    if len(cols) == len(df.columns):
+        return df  # nothing to drop, so skip the copy made by column selection
+    
+    return df[cols]
     
 
 def to_list(items):
@@ -412,6 +456,27 @@ def to_list(items):
     return items
 
 
+_last_timestamp = (None, None)  # (epoch second, formatted string)
+
+def _timestamp():
+    """
+    Return the current local time formatted as 'YYYYMMDD-HHMMSS'. The string only has 
+    one-second resolution, so it's reused for calls within the same second.
+    
+    Returns
+    -------
+    str
+    
+    """
+    global _last_timestamp
+    
+    now = int(time.time())
+    if _last_timestamp[0] != now:
+        _last_timestamp = (now, dt.fromtimestamp(now).strftime('%Y%m%d-%H%M%S'))
+    
+    return _last_timestamp[1]
+
+
 def update_name(template, name=None):
     """
     Generate a name for a configured model step, based on its template class and the 
@@ -432,7 +497,7 @@ def update_name(template, name=None):
     
     """
     if (name is None) or (template in name):
-        return template + '-' + dt.now().strftime('%Y%m%d-%H%M%S')
+        return template + '-' + _timestamp()
     else:
         return name
 
@@ -453,7 +518,8 @@ def get_data(tables, fallback_tables=None, filters=None, model_expression=None,
     Parameters
     ----------
     tables : str or list of str
-        Orca table(s) to draw data from.
+        Orca table(s) to draw data from. Tables can also be passed in any of the forms 
+        accepted by ``get_df()``.
     
     fallback_tables : str or list of str, optional
         Table(s) to use if first parameter evaluates to `None`. (This option will be 
@@ -480,9 +546,20 @@ def get_data(tables, fallback_tables=None, filters=None, model_expression=None,
     
     colnames = None  # this will get all columns
     if (model_expression is not None) or (extra_columns is not None):
-        colnames = list(set(columns_in_formula(model_expression) + \
-                            columns_in_filters(filters) + to_list(extra_columns)))
-
+        extras = to_list(extra_columns) if extra_columns is not None else []
+        colnames = list(dict.fromkeys(chain(columns_in_formula(model_expression), 
+                                            columns_in_filters(filters), extras)))
+
+    if isinstance(tables, list):
+        # drop repeated tables, keeping the order (a table can't merge onto itself);
+        # DataFrames aren't hashable, so anything other than a name is keyed on its id
+        unique = {}
+        for t in tables:
+            unique.setdefault(t if isinstance(t, str) else id(t), t)
+        tables = list(unique.values())
+        if len(tables) == 1:
+            tables = tables[0]
+    
     if not isinstance(tables, list):
         df = get_df(tables, colnames)
     
@@ -548,6 +625,9 @@ def update_column(table, column, data, fallback_table=None, fallback_column=None
 ## VERSION MANAGEMENT ##
 ########################
 
+_VERSION_PATTERN = re.compile(r'(\d+)\.(\d+)(?:\.(\d+))?(?:\.?dev(\d+))?$')
+
+@lru_cache(maxsize=256)
 def parse_version(v):
     """
     Parses a version string into its component parts. String is expected to follow the 
@@ -564,24 +644,16 @@ def parse_version(v):
     tuple with format (int, int, int, int or None)
     
     """
-    v4 = None
-    if 'dev' in v:
-        v4 = int(v.split('dev')[1])
-        v = v.split('dev')[0]  # 0.1.dev0 -> 0.1.
-        
-        if (v[-1] == '.'):
-            v = v[:-1]  # 0.1. -> 0.1
-        
-    v = v.split('.')
-    
-    v3 = 0
-    if (len(v) == 3):
-        v3 = int(v[2])
+    match = _VERSION_PATTERN.match(v)
+    if match is None:
+        raise ValueError("Could not parse version string: '{}'".format(v))
     
-    v2 = int(v[1])
-    v1 = int(v[0])
+    v1, v2, v3, v4 = match.groups()
     
-    return (v1, v2, v3, v4)
+    return (int(v1), 
+            int(v2), 
+            int(v3) if v3 is not None else 0, 
+            int(v4) if v4 is not None else None)
     
 
 def version_greater_or_equal(a, b):
@@ -603,29 +675,16 @@ def version_greater_or_equal(a, b):
     boolean
     
     """
+    if a == b:
+        return True
+    
     a = parse_version(a)
     b = parse_version(b)
     
-    if (a[0] > b[0]):
-        return True
-    
-    elif (a[0] == b[0]):
-        if (a[1] > b[1]):
-            return True
-            
-        elif (a[1] == b[1]):
-            if (a[2] > b[2]):
-                return True
-            
-            elif (a[2] == b[2]):
-                if (a[3] == None):
-                    return True
-                
-                elif (b[3] == None):
-                    return False
-                
-                elif (a[3] >= b[3]):
-                    return True
+    # A release sorts after all of its dev pre-releases, so treat a missing dev 
+    # component as infinite
+    a = a[:3] + (float('inf') if a[3] is None else a[3],)
+    b = b[:3] + (float('inf') if b[3] is None else b[3],)
     
-    return False
+    return a >= b
     